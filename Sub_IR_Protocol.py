@@ -6,14 +6,13 @@ Compatible with Termux and other Python environments
 """
 
 import os
-import json
-import argparse
 import sys
 import re
-from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from typing import List, Dict, Union, Optional, Tuple
 import time
-import random
+from dataclasses import dataclass, field
 
 class Colors:
     """ANSI color codes for terminal output"""
@@ -30,37 +29,203 @@ class Colors:
     def disable():
         Colors.HEADER = Colors.BLUE = Colors.CYAN = ''
         Colors.GREEN = Colors.YELLOW = Colors.RED = Colors.ENDC = Colors.BOLD = ''
+        _build_prompts()
+
+# Static color-wrapped prompts, rendered once per color setting
+PROMPTS: Dict[str, str] = {}
+
+def _build_prompts():
+    """Render PROMPTS with the current Colors values"""
+    y, e = Colors.YELLOW, Colors.ENDC
+    PROMPTS.update(
+        main=f"\n{y}Select option (1-6): {e}",
+        select_freq=f"\n{y}Select frequency: {e}",
+        custom_freq=f"\n{y}Enter frequency in Hz: {e}",
+        method=f"\n{y}Select method: {e}",
+        timing=f"\n{y}Enter timing data: {e}",
+        use_data=f"{y}Use this data? (y/n): {e}",
+        pattern=f"\n{y}Select pattern: {e}",
+        filename=f"{y}Enter filename: {e}",
+        tool=f"\n{y}Select tool: {e}",
+        save=f"\n{y}Save to file? (y/n): {e}",
+        key=f"{y}Enter hex key (or 'random' for random): {e}",
+        data=f"{y}Enter hex data (optional, press Enter to skip): {e}",
+        address=f"{y}Enter address (hex): {e}",
+        command=f"{y}Enter command (hex): {e}",
+    )
+
+_build_prompts()
+
+def _color_supported() -> bool:
+    """Color only when stdout is a terminal and NO_COLOR is not set"""
+    return sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
+def _emit(*lines):
+    """Write several lines to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _ask(prompt: str) -> str:
+    """Prompt for one line of input; raises EOFError on end of input like input()"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\r\n')
+
+_DIGITS = {str(i): i for i in range(10)}
+
+def _fast_int(text: str, _digit=_DIGITS.get) -> int:
+    """int() with a table shortcut for the single-digit answers most prompts get"""
+    value = _digit(text)
+    return int(text) if value is None else value
+
+def _ask_default(label: str, default, cast=_fast_int, unit: str = "", _ask=_ask):
+    """Prompt for a value showing its default; empty input returns the default"""
+    # _ask is bound as a default argument so the lookup is local;
+    # Colors is read at call time because disable() rewrites it
+    value = _ask(f"{Colors.YELLOW}{label} [{default}{unit}]: {Colors.ENDC}").strip()
+    return cast(value) if value else default
+
+def _write_file(path: str, payload: bytes):
+    """Write a complete file with as few write() syscalls as possible"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _parse_timing(text) -> List[int]:
+    """Parse whitespace-separated timing values (str or bytes) into ints"""
+    # split() and int() both run in C; no per-token bytecode
+    return list(map(int, text.split()))
+
+def _format_timing(values) -> str:
+    """Space-separate timing values for RAW_Data/data lines"""
+    # One %-format call converts every value in C, ~2x faster than join(map(str))
+    values = tuple(values)
+    return ' '.join(['%d'] * len(values)) % values
+
+_HEX_STRIP = str.maketrans('', '', ' \t\r\n_')
+
+def _clean_hex(text: str) -> str:
+    """Drop an optional 0x prefix plus any whitespace/underscores from hex input"""
+    text = text.strip()
+    if text[:2].lower() == '0x':
+        text = text[2:]
+    return text.translate(_HEX_STRIP)
+
+def _bulk_random_keys(n: int, key_bytes: int) -> List[str]:
+    """Generate n random keys as spaced uppercase hex, key_bytes bytes each"""
+    # One urandom call and one hex() pass cover the whole batch; every key
+    # is then a fixed-width slice of the text (2 digits + separator per byte)
+    text = os.urandom(n * key_bytes).hex(' ').upper()
+    width = key_bytes * 3
+    return [text[i:i + width - 1] for i in range(0, n * width, width)]
+
+# Flipper Zero Sub-GHz bands in Hz
+_FREQ_RANGES = ((300000000, 348000000), (387000000, 464000000), (779000000, 928000000))
+_FREQ_STRIP = str.maketrans('', '', ', ')
+_FREQ_RE = re.compile(r'([\d.]+)(mhz|khz)?', re.IGNORECASE)
+_FREQ_SCALE = {'mhz': 1000000, 'khz': 1000}
+
+_NON_BITS = str.maketrans('', '', '01')
+
+@lru_cache(maxsize=16)
+def _nibble_table(one: Tuple[int, ...], zero: Tuple[int, ...]) -> Dict[str, Tuple[int, ...]]:
+    """Map each hex digit to the timing values of its four bits"""
+    pairs = {'0': zero, '1': one}
+    return {f"{i:x}": sum((pairs[b] for b in f"{i:04b}"), ()) for i in range(16)}
+
+def _encode_nibbles(digits: str, one: Tuple[int, ...], zero: Tuple[int, ...], pattern: List[int]) -> List[int]:
+    """Append the timing values for a string of hex digits, MSB first"""
+    extend = pattern.extend
+    for chunk in map(_nibble_table(one, zero).__getitem__, digits.lower()):
+        extend(chunk)
+    return pattern
+
+def _encode_bits(bits: str, one: Tuple[int, ...], zero: Tuple[int, ...]) -> List[int]:
+    """Expand a binary string into timing values, skipping non-bit characters"""
+    if bits.translate(_NON_BITS):
+        bits = ''.join(filter('01'.__contains__, bits))
+    
+    # Leading bits that don't fill a nibble are encoded one at a time
+    head = len(bits) % 4
+    pattern = []
+    extend = pattern.extend
+    for bit in bits[:head]:
+        extend(one if bit == '1' else zero)
+    
+    # The rest goes through a 16-entry table, four bits per lookup;
+    # int() and format() turn the bit string into hex digits in C
+    if len(bits) > head:
+        digits = format(int(bits[head:], 2), f"0{(len(bits) - head) // 4}x")
+        _encode_nibbles(digits, one, zero, pattern)
+    return pattern
+
+@dataclass(slots=True, frozen=True)
+class SubGhzProtocol:
+    """Sub-GHz protocol specification"""
+    bits: int
+    key_bytes: int
+    needs_te: bool
+    description: str
+    default_te: int = 400
+    hex_chars: int = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'hex_chars', self.key_bytes * 2)
+
+@dataclass(slots=True, frozen=True)
+class IrProtocol:
+    """Infrared protocol specification"""
+    address_bits: int
+    command_bits: int
+    description: str
 
 class InteractiveFlipperGenerator:
+    # Built once at import; common_ir_patterns hands out copies
+    COMMON_IR_PATTERNS = (
+        ("Power On/Off", (9000, -4500, 560, -1690, 560, -560, 560, -1690, 560)),
+        ("Volume Up", (9000, -4500, 560, -560, 560, -1690, 560, -560, 560)),
+        ("Volume Down", (9000, -4500, 560, -1690, 560, -1690, 560, -560, 560)),
+        ("Channel Up", (9000, -4500, 560, -560, 560, -560, 560, -1690, 560)),
+        ("Channel Down", (9000, -4500, 560, -1690, 560, -560, 560, -1690, 560))
+    )
+    
     def __init__(self):
         self.version = "2.0.0"
+        # The working directory never changes while the generator runs
+        self._cwd = os.getcwd()
         
         # CORRECTED protocol specifications based on actual Flipper Zero GitHub examples
         self.subghz_protocols = {
-            "Princeton": {"bits": 24, "key_bytes": 8, "needs_te": True, "default_te": 400, "description": "Common garage door openers (24-bit data, 8-byte key)"},
-            "Nice_Flo": {"bits": 12, "key_bytes": 3, "needs_te": False, "description": "Nice rolling code remotes (12-bit)"},
-            "Came": {"bits": 12, "key_bytes": 3, "needs_te": False, "description": "CAME gate remotes (12-bit)"},
-            "Linear": {"bits": 10, "key_bytes": 3, "needs_te": False, "description": "Linear garage door openers (10-bit)"},
-            "Gate_TX": {"bits": 24, "key_bytes": 6, "needs_te": False, "description": "Generic gate transmitters (24-bit)"},
-            "Chamberlain": {"bits": 32, "key_bytes": 8, "needs_te": False, "description": "Chamberlain garage doors (32-bit)"},
-            "DoorHan": {"bits": 24, "key_bytes": 6, "needs_te": False, "description": "DoorHan gate systems (24-bit)"},
-            "Somfy_Telis": {"bits": 56, "key_bytes": 14, "needs_te": False, "description": "Somfy window blinds (56-bit)"},
-            "Star_Line": {"bits": 64, "key_bytes": 16, "needs_te": False, "description": "StarLine car alarms (64-bit)"},
-            "Holtek": {"bits": 40, "key_bytes": 10, "needs_te": False, "description": "Holtek microcontroller remotes (40-bit)"},
-            "RAW": {"bits": 0, "key_bytes": 0, "needs_te": False, "description": "Custom raw timing data"}
+            "Princeton": SubGhzProtocol(bits=24, key_bytes=8, needs_te=True, default_te=400, description="Common garage door openers (24-bit data, 8-byte key)"),
+            "Nice_Flo": SubGhzProtocol(bits=12, key_bytes=3, needs_te=False, description="Nice rolling code remotes (12-bit)"),
+            "Came": SubGhzProtocol(bits=12, key_bytes=3, needs_te=False, description="CAME gate remotes (12-bit)"),
+            "Linear": SubGhzProtocol(bits=10, key_bytes=3, needs_te=False, description="Linear garage door openers (10-bit)"),
+            "Gate_TX": SubGhzProtocol(bits=24, key_bytes=6, needs_te=False, description="Generic gate transmitters (24-bit)"),
+            "Chamberlain": SubGhzProtocol(bits=32, key_bytes=8, needs_te=False, description="Chamberlain garage doors (32-bit)"),
+            "DoorHan": SubGhzProtocol(bits=24, key_bytes=6, needs_te=False, description="DoorHan gate systems (24-bit)"),
+            "Somfy_Telis": SubGhzProtocol(bits=56, key_bytes=14, needs_te=False, description="Somfy window blinds (56-bit)"),
+            "Star_Line": SubGhzProtocol(bits=64, key_bytes=16, needs_te=False, description="StarLine car alarms (64-bit)"),
+            "Holtek": SubGhzProtocol(bits=40, key_bytes=10, needs_te=False, description="Holtek microcontroller remotes (40-bit)"),
+            "RAW": SubGhzProtocol(bits=0, key_bytes=0, needs_te=False, description="Custom raw timing data")
         }
         
         # CORRECTED IR protocol specifications
         self.ir_protocols = {
-            "NEC": {"address_bits": 8, "command_bits": 8, "description": "Most common IR protocol (8+8 bits)"},
-            "NECext": {"address_bits": 16, "command_bits": 8, "description": "Extended NEC protocol (16+8 bits)"},
-            "Samsung32": {"address_bits": 8, "command_bits": 8, "description": "Samsung TVs and devices (8+8 bits)"},
-            "RC5": {"address_bits": 5, "command_bits": 6, "description": "Philips RC5 protocol (5+6 bits)"},
-            "RC6": {"address_bits": 8, "command_bits": 8, "description": "Philips RC6 protocol (8+8 bits)"},
-            "SIRC": {"address_bits": 5, "command_bits": 7, "description": "Sony SIRC 12-bit (5+7 bits)"},
-            "SIRC15": {"address_bits": 8, "command_bits": 7, "description": "Sony SIRC 15-bit (8+7 bits)"},
-            "SIRC20": {"address_bits": 13, "command_bits": 7, "description": "Sony SIRC 20-bit (13+7 bits)"},
-            "RAW": {"address_bits": 0, "command_bits": 0, "description": "Custom raw IR timing"}
+            "NEC": IrProtocol(address_bits=8, command_bits=8, description="Most common IR protocol (8+8 bits)"),
+            "NECext": IrProtocol(address_bits=16, command_bits=8, description="Extended NEC protocol (16+8 bits)"),
+            "Samsung32": IrProtocol(address_bits=8, command_bits=8, description="Samsung TVs and devices (8+8 bits)"),
+            "RC5": IrProtocol(address_bits=5, command_bits=6, description="Philips RC5 protocol (5+6 bits)"),
+            "RC6": IrProtocol(address_bits=8, command_bits=8, description="Philips RC6 protocol (8+8 bits)"),
+            "SIRC": IrProtocol(address_bits=5, command_bits=7, description="Sony SIRC 12-bit (5+7 bits)"),
+            "SIRC15": IrProtocol(address_bits=8, command_bits=7, description="Sony SIRC 15-bit (8+7 bits)"),
+            "SIRC20": IrProtocol(address_bits=13, command_bits=7, description="Sony SIRC 20-bit (13+7 bits)"),
+            "RAW": IrProtocol(address_bits=0, command_bits=0, description="Custom raw IR timing")
         }
         
         self.common_frequencies = {
@@ -69,26 +234,66 @@ class InteractiveFlipperGenerator:
             "868 MHz": 868000000,
             "915 MHz": 915000000
         }
+        
+        # Selection menus are rendered once; the tables above never change
+        self._subghz_keys = tuple(self.subghz_protocols)
+        self._ir_keys = tuple(self.ir_protocols)
+        self._subghz_menu_str = self._render_protocol_menu("SUBGHZ", self.subghz_protocols)
+        # Keys already in the file's canonical form ("AA BB CC") skip normalization
+        self._key_fast_re = {
+            key_bytes: re.compile(rf"(?:[0-9A-F]{{2}} ){{{key_bytes - 1}}}[0-9A-F]{{2}}")
+            for key_bytes in {info.key_bytes for info in self.subghz_protocols.values() if info.key_bytes}
+        }
+        self._ir_menu_str = self._render_protocol_menu("IR", self.ir_protocols)
+        
+        self._freq_list = tuple(self.common_frequencies.items())
+        freq_lines = [f"\n{Colors.CYAN}Frequency Selection:{Colors.ENDC}"]
+        freq_lines += [f"{Colors.BLUE}{i}.{Colors.ENDC} {name} ({freq:,} Hz)"
+                       for i, (name, freq) in enumerate(self._freq_list, 1)]
+        freq_lines.append(f"{Colors.BLUE}{len(self._freq_list)+1}.{Colors.ENDC} Custom frequency")
+        self._freq_menu_str = "\n".join(freq_lines)
+        self._protocols_blob = self._render_protocol_info()
+        
+        # Selection prompts depend on the table sizes; the rest live in PROMPTS
+        self._prompt_select_subghz = self._render_select_prompt(len(self._subghz_keys))
+        self._prompt_select_ir = self._render_select_prompt(len(self._ir_keys))
+
+    @staticmethod
+    def _render_select_prompt(count: int) -> str:
+        """Render the protocol selection prompt for a menu of the given size"""
+        return f"\n{Colors.YELLOW}Select protocol (1-{count}) or 'q' to quit: {Colors.ENDC}"
+
+    @staticmethod
+    def _render_protocol_menu(label: str, protocols: Dict[str, Union[SubGhzProtocol, IrProtocol]]) -> str:
+        """Render a numbered protocol selection menu"""
+        lines = [f"\n{Colors.CYAN}Available {label} Protocols:{Colors.ENDC}"]
+        lines += [f"{Colors.BLUE}{i:2d}.{Colors.ENDC} {name:15} - {info.description}"
+                  for i, (name, info) in enumerate(protocols.items(), 1)]
+        return "\n".join(lines)
 
     def print_banner(self):
         """Print welcome banner"""
-        print(f"\n{Colors.CYAN}{'='*60}")
-        print(f"{Colors.BOLD}🐬 Interactive Flipper Zero Protocol Generator v{self.version}")
-        print(f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n")
+        _emit(
+            f"\n{Colors.CYAN}{'='*60}",
+            f"{Colors.BOLD}🐬 Interactive Flipper Zero Protocol Generator v{self.version}",
+            f"{Colors.CYAN}{'='*60}{Colors.ENDC}\n"
+        )
 
     def main_menu(self):
         """Display main menu and handle selection"""
         while True:
-            print(f"\n{Colors.HEADER}Main Menu:{Colors.ENDC}")
-            print(f"{Colors.BLUE}1.{Colors.ENDC} Create Sub-GHz Protocol File")
-            print(f"{Colors.BLUE}2.{Colors.ENDC} Create Infrared Protocol File")
-            print(f"{Colors.BLUE}3.{Colors.ENDC} Signal Analysis Tools")
-            print(f"{Colors.BLUE}4.{Colors.ENDC} Generate Sample Files")
-            print(f"{Colors.BLUE}5.{Colors.ENDC} View Protocol Information")
-            print(f"{Colors.BLUE}6.{Colors.ENDC} Exit")
+            _emit(
+                f"\n{Colors.HEADER}Main Menu:{Colors.ENDC}",
+                f"{Colors.BLUE}1.{Colors.ENDC} Create Sub-GHz Protocol File",
+                f"{Colors.BLUE}2.{Colors.ENDC} Create Infrared Protocol File",
+                f"{Colors.BLUE}3.{Colors.ENDC} Signal Analysis Tools",
+                f"{Colors.BLUE}4.{Colors.ENDC} Generate Sample Files",
+                f"{Colors.BLUE}5.{Colors.ENDC} View Protocol Information",
+                f"{Colors.BLUE}6.{Colors.ENDC} Exit"
+            )
             
             try:
-                choice = input(f"\n{Colors.YELLOW}Select option (1-6): {Colors.ENDC}").strip()
+                choice = _ask(PROMPTS['main']).strip()
                 
                 if choice == '1':
                     self.subghz_wizard()
@@ -106,7 +311,7 @@ class InteractiveFlipperGenerator:
                 else:
                     print(f"{Colors.RED}Invalid choice. Please select 1-6.{Colors.ENDC}")
                     
-            except KeyboardInterrupt:
+            except (KeyboardInterrupt, EOFError):
                 print(f"\n\n{Colors.GREEN}Goodbye! 🐬{Colors.ENDC}")
                 break
             except Exception as e:
@@ -139,6 +344,8 @@ class InteractiveFlipperGenerator:
                 output_file=output_file
             )
         else:
+            protocol_info = self.subghz_protocols[protocol]
+            
             # Get protocol-specific data
             key, data, te = self.get_protocol_data(protocol)
             repeat = self.get_repeat_count()
@@ -152,12 +359,11 @@ class InteractiveFlipperGenerator:
                 'key': key,
                 'repeat': repeat,
                 'output_file': output_file,
-                'bit_count': self.subghz_protocols[protocol]['bits']
+                'bit_count': protocol_info.bits
             }
             
             # Only add TE if the protocol needs it
-            protocol_info = self.subghz_protocols[protocol]
-            if protocol_info.get('needs_te', False) and te:
+            if protocol_info.needs_te and te:
                 params['te'] = te
             
             # Add data if provided
@@ -207,17 +413,16 @@ class InteractiveFlipperGenerator:
 
     def select_protocol(self, protocol_type: str) -> Optional[str]:
         """Interactive protocol selection"""
-        protocols = self.subghz_protocols if protocol_type == "subghz" else self.ir_protocols
-        
-        print(f"\n{Colors.CYAN}Available {protocol_type.upper()} Protocols:{Colors.ENDC}")
-        protocol_list = list(protocols.keys())
+        if protocol_type == "subghz":
+            protocol_list, menu, prompt = self._subghz_keys, self._subghz_menu_str, self._prompt_select_subghz
+        else:
+            protocol_list, menu, prompt = self._ir_keys, self._ir_menu_str, self._prompt_select_ir
         
-        for i, (name, info) in enumerate(protocols.items(), 1):
-            print(f"{Colors.BLUE}{i:2d}.{Colors.ENDC} {name:15} - {info['description']}")
+        _emit(menu)
         
         while True:
             try:
-                choice = input(f"\n{Colors.YELLOW}Select protocol (1-{len(protocols)}) or 'q' to quit: {Colors.ENDC}").strip()
+                choice = _ask(prompt).strip()
                 if choice.lower() == 'q':
                     return None
                 
@@ -227,22 +432,18 @@ class InteractiveFlipperGenerator:
                     print(f"{Colors.GREEN}Selected: {selected}{Colors.ENDC}")
                     return selected
                 else:
-                    print(f"{Colors.RED}Invalid choice. Enter 1-{len(protocols)} or 'q' to quit.{Colors.ENDC}")
+                    print(f"{Colors.RED}Invalid choice. Enter 1-{len(protocol_list)} or 'q' to quit.{Colors.ENDC}")
             except (ValueError, KeyboardInterrupt):
                 return None
 
     def select_frequency(self) -> Optional[int]:
         """Interactive frequency selection"""
-        print(f"\n{Colors.CYAN}Frequency Selection:{Colors.ENDC}")
-        
-        freq_list = list(self.common_frequencies.items())
-        for i, (name, freq) in enumerate(freq_list, 1):
-            print(f"{Colors.BLUE}{i}.{Colors.ENDC} {name} ({freq:,} Hz)")
-        print(f"{Colors.BLUE}{len(freq_list)+1}.{Colors.ENDC} Custom frequency")
+        freq_list = self._freq_list
+        _emit(self._freq_menu_str)
         
         while True:
             try:
-                choice = input(f"\n{Colors.YELLOW}Select frequency: {Colors.ENDC}").strip()
+                choice = _ask(PROMPTS['select_freq']).strip()
                 if choice.lower() == 'q':
                     return None
                 
@@ -267,26 +468,26 @@ class InteractiveFlipperGenerator:
         
         while True:
             try:
-                freq_str = input(f"\n{Colors.YELLOW}Enter frequency in Hz: {Colors.ENDC}").strip()
+                freq_str = _ask(PROMPTS['custom_freq']).strip()
                 if freq_str.lower() == 'q':
                     return None
                 
-                # Handle common formats
-                freq_str = freq_str.replace(',', '').replace(' ', '')
-                if freq_str.lower().endswith('mhz'):
-                    frequency = int(float(freq_str[:-3]) * 1000000)
-                elif freq_str.lower().endswith('khz'):
-                    frequency = int(float(freq_str[:-3]) * 1000)
+                # Handle common formats (plain Hz, or with a MHz/kHz suffix)
+                match = _FREQ_RE.fullmatch(freq_str.translate(_FREQ_STRIP))
+                if not match:
+                    raise ValueError(freq_str)
+                number, unit = match.groups()
+                if unit:
+                    frequency = int(float(number) * _FREQ_SCALE[unit.lower()])
                 else:
-                    frequency = int(freq_str)
+                    frequency = int(number)
                 
                 # Validate range
-                valid_ranges = [(300000000, 348000000), (387000000, 464000000), (779000000, 928000000)]
-                in_range = any(start <= frequency <= end for start, end in valid_ranges)
+                in_range = any(start <= frequency <= end for start, end in _FREQ_RANGES)
                 
                 if not in_range:
                     print(f"{Colors.YELLOW}Warning: {frequency:,} Hz may not work with Flipper Zero{Colors.ENDC}")
-                    confirm = input("Continue anyway? (y/n): ").strip().lower()
+                    confirm = _ask("Continue anyway? (y/n): ").strip().lower()
                     if confirm != 'y':
                         continue
                 
@@ -297,13 +498,15 @@ class InteractiveFlipperGenerator:
 
     def create_raw_subghz_data(self) -> Optional[List[int]]:
         """Interactive RAW Sub-GHz data creation"""
-        print(f"\n{Colors.CYAN}RAW Sub-GHz Data Creation{Colors.ENDC}")
-        print("Options:")
-        print(f"{Colors.BLUE}1.{Colors.ENDC} Manual entry (space-separated timing values)")
-        print(f"{Colors.BLUE}2.{Colors.ENDC} Pattern generator")
-        print(f"{Colors.BLUE}3.{Colors.ENDC} Load from file")
+        _emit(
+            f"\n{Colors.CYAN}RAW Sub-GHz Data Creation{Colors.ENDC}",
+            "Options:",
+            f"{Colors.BLUE}1.{Colors.ENDC} Manual entry (space-separated timing values)",
+            f"{Colors.BLUE}2.{Colors.ENDC} Pattern generator",
+            f"{Colors.BLUE}3.{Colors.ENDC} Load from file"
+        )
         
-        choice = input(f"\n{Colors.YELLOW}Select method: {Colors.ENDC}").strip()
+        choice = _ask(PROMPTS['method']).strip()
         
         if choice == '1':
             return self.manual_raw_entry()
@@ -317,14 +520,16 @@ class InteractiveFlipperGenerator:
 
     def create_raw_ir_data(self) -> Optional[List[int]]:
         """Interactive RAW IR data creation"""
-        print(f"\n{Colors.CYAN}RAW IR Data Creation{Colors.ENDC}")
-        print("Options:")
-        print(f"{Colors.BLUE}1.{Colors.ENDC} Manual entry")
-        print(f"{Colors.BLUE}2.{Colors.ENDC} Pattern generator")
-        print(f"{Colors.BLUE}3.{Colors.ENDC} Load from file")
-        print(f"{Colors.BLUE}4.{Colors.ENDC} Common IR patterns")
+        _emit(
+            f"\n{Colors.CYAN}RAW IR Data Creation{Colors.ENDC}",
+            "Options:",
+            f"{Colors.BLUE}1.{Colors.ENDC} Manual entry",
+            f"{Colors.BLUE}2.{Colors.ENDC} Pattern generator",
+            f"{Colors.BLUE}3.{Colors.ENDC} Load from file",
+            f"{Colors.BLUE}4.{Colors.ENDC} Common IR patterns"
+        )
         
-        choice = input(f"\n{Colors.YELLOW}Select method: {Colors.ENDC}").strip()
+        choice = _ask(PROMPTS['method']).strip()
         
         if choice == '1':
             return self.manual_raw_entry()
@@ -348,7 +553,7 @@ class InteractiveFlipperGenerator:
         
         while True:
             try:
-                data_str = input(f"\n{Colors.YELLOW}Enter timing data: {Colors.ENDC}").strip()
+                data_str = _ask(PROMPTS['timing']).strip()
                 
                 if data_str.lower() == 'q':
                     return None
@@ -357,18 +562,16 @@ class InteractiveFlipperGenerator:
                     continue
                 
                 # Parse the data
-                raw_data = []
-                for value in data_str.split():
-                    raw_data.append(int(value))
+                raw_data = _parse_timing(data_str)
                 
                 if len(raw_data) < 4:
                     print(f"{Colors.RED}Need at least 4 timing values{Colors.ENDC}")
                     continue
                 
                 print(f"{Colors.GREEN}Parsed {len(raw_data)} timing values{Colors.ENDC}")
-                self.preview_timing(raw_data[:20])  # Show first 20 values
+                self.preview_timing(raw_data, limit=20)
                 
-                confirm = input(f"{Colors.YELLOW}Use this data? (y/n): {Colors.ENDC}").strip().lower()
+                confirm = _ask(PROMPTS['use_data']).strip().lower()
                 if confirm == 'y':
                     return raw_data
                     
@@ -392,7 +595,7 @@ class InteractiveFlipperGenerator:
             print(f"{Colors.BLUE}{i}.{Colors.ENDC} {name}")
         
         try:
-            choice = int(input(f"\n{Colors.YELLOW}Select pattern: {Colors.ENDC}")) - 1
+            choice = int(_ask(PROMPTS['pattern'])) - 1
             if 0 <= choice < len(pattern_list):
                 pattern_name = pattern_list[choice]
                 return patterns[pattern_name]()
@@ -404,15 +607,12 @@ class InteractiveFlipperGenerator:
     def generate_simple_onoff(self) -> List[int]:
         """Generate simple on-off pattern"""
         try:
-            on_time = int(input("ON time (microseconds): "))
-            off_time = int(input("OFF time (microseconds): "))
-            repeats = int(input("Number of repeats: "))
-            
-            pattern = []
-            for _ in range(repeats):
-                pattern.extend([on_time, -off_time])
+            on_time = int(_ask("ON time (microseconds): "))
+            off_time = int(_ask("OFF time (microseconds): "))
+            repeats = int(_ask("Number of repeats: "))
             
-            return pattern
+            # List repetition copies the pair in C
+            return [on_time, -off_time] * repeats
         except ValueError:
             print(f"{Colors.RED}Invalid input{Colors.ENDC}")
             return []
@@ -420,17 +620,12 @@ class InteractiveFlipperGenerator:
     def generate_manchester(self) -> List[int]:
         """Generate Manchester encoded pattern"""
         try:
-            bit_time = int(input("Bit time (microseconds): "))
-            data = input("Binary data (e.g., 1010110): ").strip()
+            bit_time = int(_ask("Bit time (microseconds): "))
+            data = _ask("Binary data (e.g., 1010110): ").strip()
             
-            pattern = []
-            for bit in data:
-                if bit == '1':
-                    pattern.extend([bit_time//2, -bit_time//2])
-                elif bit == '0':
-                    pattern.extend([-bit_time//2, bit_time//2])
-            
-            return pattern
+            return _encode_bits(data,
+                                one=(bit_time//2, -bit_time//2),
+                                zero=(-bit_time//2, bit_time//2))
         except ValueError:
             print(f"{Colors.RED}Invalid input{Colors.ENDC}")
             return []
@@ -438,19 +633,12 @@ class InteractiveFlipperGenerator:
     def generate_pwm(self) -> List[int]:
         """Generate PWM pattern"""
         try:
-            short_pulse = int(input("Short pulse (microseconds): "))
-            long_pulse = int(input("Long pulse (microseconds): "))
-            gap = int(input("Gap between pulses (microseconds): "))
-            data = input("Binary data (1=long, 0=short): ").strip()
-            
-            pattern = []
-            for bit in data:
-                if bit == '1':
-                    pattern.extend([long_pulse, -gap])
-                elif bit == '0':
-                    pattern.extend([short_pulse, -gap])
+            short_pulse = int(_ask("Short pulse (microseconds): "))
+            long_pulse = int(_ask("Long pulse (microseconds): "))
+            gap = int(_ask("Gap between pulses (microseconds): "))
+            data = _ask("Binary data (1=long, 0=short): ").strip()
             
-            return pattern
+            return _encode_bits(data, one=(long_pulse, -gap), zero=(short_pulse, -gap))
         except ValueError:
             print(f"{Colors.RED}Invalid input{Colors.ENDC}")
             return []
@@ -459,18 +647,19 @@ class InteractiveFlipperGenerator:
         """Generate custom repeating pattern"""
         try:
             print("Enter base pattern (space-separated values):")
-            base_str = input().strip()
-            base_pattern = [int(x) for x in base_str.split()]
+            base_str = _ask("").strip()
+            base_pattern = _parse_timing(base_str)
             
-            repeats = int(input("Number of repeats: "))
-            gap = int(input("Gap between repeats (microseconds, 0 for none): "))
+            repeats = int(_ask("Number of repeats: "))
+            gap = int(_ask("Gap between repeats (microseconds, 0 for none): "))
             
-            pattern = []
-            for i in range(repeats):
-                pattern.extend(base_pattern)
-                if gap > 0 and i < repeats - 1:
-                    pattern.append(-gap)
+            if gap <= 0:
+                return base_pattern * repeats
             
+            # Gap goes between copies only, so drop the trailing one
+            pattern = (base_pattern + [-gap]) * repeats
+            if pattern:
+                pattern.pop()
             return pattern
         except ValueError:
             print(f"{Colors.RED}Invalid input{Colors.ENDC}")
@@ -478,12 +667,14 @@ class InteractiveFlipperGenerator:
 
     def pattern_generator_ir(self) -> Optional[List[int]]:
         """Generate IR-specific patterns"""
-        print(f"\n{Colors.CYAN}IR Pattern Generator{Colors.ENDC}")
-        print("1. NEC-like pattern")
-        print("2. RC5-like pattern")
-        print("3. Custom IR pattern")
+        _emit(
+            f"\n{Colors.CYAN}IR Pattern Generator{Colors.ENDC}",
+            "1. NEC-like pattern",
+            "2. RC5-like pattern",
+            "3. Custom IR pattern"
+        )
         
-        choice = input("Select pattern: ").strip()
+        choice = _ask("Select pattern: ").strip()
         
         if choice == '1':
             return self.generate_nec_like()
@@ -497,25 +688,16 @@ class InteractiveFlipperGenerator:
     def generate_nec_like(self) -> List[int]:
         """Generate NEC-like IR pattern"""
         try:
-            # NEC protocol basics
-            pattern = [9000, -4500]  # Leader
-            
             # Get data
-            data = input("Enter 32-bit hex data (e.g., 0x12345678): ").strip()
-            if data.startswith('0x'):
-                data = data[2:]
+            value = int(_clean_hex(_ask("Enter 32-bit hex data (e.g., 0x12345678): ")), 16)
+            if not 0 <= value <= 0xFFFFFFFF:
+                raise ValueError(value)
             
-            # Convert to binary
-            binary = bin(int(data, 16))[2:].zfill(32)
-            
-            # Add bits (NEC uses 560µs pulses)
-            for bit in binary:
-                if bit == '1':
-                    pattern.extend([560, -1690])  # Logical 1
-                else:
-                    pattern.extend([560, -560])   # Logical 0
-            
-            pattern.append(560)  # Stop bit
+            # NEC protocol basics: leader, 560µs-pulse bits, stop bit.
+            # The hex digits index the nibble table directly, no bit string needed
+            pattern = [9000, -4500]
+            _encode_nibbles(format(value, '08x'), one=(560, -1690), zero=(560, -560), pattern=pattern)
+            pattern.append(560)
             
             return pattern
         except ValueError:
@@ -526,41 +708,25 @@ class InteractiveFlipperGenerator:
         """Generate RC5-like IR pattern"""
         try:
             bit_time = 889  # RC5 bit time
-            data = input("Enter 13-bit binary data: ").strip()
-            
-            pattern = []
-            for bit in data:
-                if bit == '1':
-                    pattern.extend([-bit_time, bit_time])
-                elif bit == '0':
-                    pattern.extend([bit_time, -bit_time])
+            data = _ask("Enter 13-bit binary data: ").strip()
             
-            return pattern
+            return _encode_bits(data, one=(-bit_time, bit_time), zero=(bit_time, -bit_time))
         except ValueError:
             print(f"{Colors.RED}Invalid binary data{Colors.ENDC}")
             return []
 
     def common_ir_patterns(self) -> Optional[List[int]]:
         """Common IR patterns library"""
-        print(f"\n{Colors.CYAN}Common IR Patterns{Colors.ENDC}")
+        patterns = self.COMMON_IR_PATTERNS
         
-        patterns = {
-            "Power On/Off": [9000, -4500, 560, -1690, 560, -560, 560, -1690, 560],
-            "Volume Up": [9000, -4500, 560, -560, 560, -1690, 560, -560, 560],
-            "Volume Down": [9000, -4500, 560, -1690, 560, -1690, 560, -560, 560],
-            "Channel Up": [9000, -4500, 560, -560, 560, -560, 560, -1690, 560],
-            "Channel Down": [9000, -4500, 560, -1690, 560, -560, 560, -1690, 560]
-        }
-        
-        pattern_list = list(patterns.keys())
-        for i, name in enumerate(pattern_list, 1):
-            print(f"{Colors.BLUE}{i}.{Colors.ENDC} {name}")
+        lines = [f"\n{Colors.CYAN}Common IR Patterns{Colors.ENDC}"]
+        lines += [f"{Colors.BLUE}{i}.{Colors.ENDC} {name}" for i, (name, _) in enumerate(patterns, 1)]
+        _emit(*lines)
         
         try:
-            choice = int(input(f"\n{Colors.YELLOW}Select pattern: {Colors.ENDC}")) - 1
-            if 0 <= choice < len(pattern_list):
-                pattern_name = pattern_list[choice]
-                return patterns[pattern_name]
+            choice = int(_ask(PROMPTS['pattern'])) - 1
+            if 0 <= choice < len(patterns):
+                return list(patterns[choice][1])
         except (ValueError, IndexError):
             print(f"{Colors.RED}Invalid choice{Colors.ENDC}")
         
@@ -568,14 +734,17 @@ class InteractiveFlipperGenerator:
 
     def load_raw_from_file(self) -> Optional[List[int]]:
         """Load raw data from file"""
-        filename = input(f"{Colors.YELLOW}Enter filename: {Colors.ENDC}").strip()
+        filename = _ask(PROMPTS['filename']).strip()
         
         try:
-            with open(filename, 'r') as f:
-                content = f.read().strip()
+            # Parse the raw bytes directly; int() accepts ASCII digits,
+            # so large captures skip the decode into a str copy
+            with open(filename, 'rb') as f:
+                raw_data = _parse_timing(f.read())
             
-            # Try to parse as space-separated integers
-            raw_data = [int(x) for x in content.split()]
+            if not raw_data:
+                print(f"{Colors.RED}No timing values found in {filename}{Colors.ENDC}")
+                return None
             
             print(f"{Colors.GREEN}Loaded {len(raw_data)} values from {filename}{Colors.ENDC}")
             return raw_data
@@ -589,13 +758,15 @@ class InteractiveFlipperGenerator:
 
     def analysis_tools(self):
         """Signal analysis and conversion tools"""
-        print(f"\n{Colors.HEADER}🔧 Signal Analysis Tools{Colors.ENDC}")
-        print(f"{Colors.BLUE}1.{Colors.ENDC} Convert binary to timing")
-        print(f"{Colors.BLUE}2.{Colors.ENDC} Analyze timing pattern")
-        print(f"{Colors.BLUE}3.{Colors.ENDC} Calculate protocol parameters")
-        print(f"{Colors.BLUE}4.{Colors.ENDC} Hex to binary converter")
+        _emit(
+            f"\n{Colors.HEADER}🔧 Signal Analysis Tools{Colors.ENDC}",
+            f"{Colors.BLUE}1.{Colors.ENDC} Convert binary to timing",
+            f"{Colors.BLUE}2.{Colors.ENDC} Analyze timing pattern",
+            f"{Colors.BLUE}3.{Colors.ENDC} Calculate protocol parameters",
+            f"{Colors.BLUE}4.{Colors.ENDC} Hex to binary converter"
+        )
         
-        choice = input(f"\n{Colors.YELLOW}Select tool: {Colors.ENDC}").strip()
+        choice = _ask(PROMPTS['tool']).strip()
         
         if choice == '1':
             self.binary_to_timing()
@@ -610,50 +781,44 @@ class InteractiveFlipperGenerator:
         """Convert binary data to timing values"""
         print(f"\n{Colors.CYAN}Binary to Timing Converter{Colors.ENDC}")
         
-        binary = input("Enter binary data: ").strip()
-        short_pulse = int(input("Short pulse time (µs): "))
-        long_pulse = int(input("Long pulse time (µs): "))
+        binary = _ask("Enter binary data: ").strip()
+        short_pulse = int(_ask("Short pulse time (µs): "))
+        long_pulse = int(_ask("Long pulse time (µs): "))
         
-        encoding = input("Encoding type (pwm/manchester) [pwm]: ").strip().lower() or "pwm"
+        encoding = _ask("Encoding type (pwm/manchester) [pwm]: ").strip().lower() or "pwm"
         
         timing = []
         if encoding == "pwm":
-            for bit in binary:
-                if bit == '1':
-                    timing.extend([long_pulse, -short_pulse])
-                elif bit == '0':
-                    timing.extend([short_pulse, -short_pulse])
+            timing = _encode_bits(binary, one=(long_pulse, -short_pulse), zero=(short_pulse, -short_pulse))
         elif encoding == "manchester":
-            for bit in binary:
-                if bit == '1':
-                    timing.extend([short_pulse, -short_pulse])
-                elif bit == '0':
-                    timing.extend([-short_pulse, short_pulse])
+            timing = _encode_bits(binary, one=(short_pulse, -short_pulse), zero=(-short_pulse, short_pulse))
         
-        print(f"\n{Colors.GREEN}Generated timing:{Colors.ENDC}")
-        print(" ".join(map(str, timing)))
+        # Format once; the same string is shown and saved
+        timing_str = _format_timing(timing)
+        _emit(f"\n{Colors.GREEN}Generated timing:{Colors.ENDC}", timing_str)
         
-        if input(f"\n{Colors.YELLOW}Save to file? (y/n): {Colors.ENDC}").lower() == 'y':
-            filename = input("Filename: ").strip() or f"timing_{int(time.time())}.txt"
+        if _ask(PROMPTS['save']).lower() == 'y':
+            filename = _ask("Filename: ").strip() or f"timing_{int(time.time())}.txt"
             with open(filename, 'w') as f:
-                f.write(" ".join(map(str, timing)))
+                f.write(timing_str)
             print(f"{Colors.GREEN}Saved to {filename}{Colors.ENDC}")
 
     def analyze_timing(self):
         """Analyze timing patterns"""
         print(f"\n{Colors.CYAN}Timing Pattern Analyzer{Colors.ENDC}")
         
-        timing_str = input("Enter timing data (space-separated): ").strip()
+        timing_str = _ask("Enter timing data (space-separated): ").strip()
         try:
-            timing = [int(x) for x in timing_str.split()]
+            timing = _parse_timing(timing_str)
+            
+            # Split once; min/max/sum/len below all run in C
+            positive_vals = [x for x in timing if x > 0]
+            negative_vals = [-x for x in timing if x < 0]
             
             print(f"\n{Colors.GREEN}Analysis Results:{Colors.ENDC}")
             print(f"Total values: {len(timing)}")
-            print(f"Positive values: {len([x for x in timing if x > 0])}")
-            print(f"Negative values: {len([x for x in timing if x < 0])}")
-            
-            positive_vals = [x for x in timing if x > 0]
-            negative_vals = [abs(x) for x in timing if x < 0]
+            print(f"Positive values: {len(positive_vals)}")
+            print(f"Negative values: {len(negative_vals)}")
             
             if positive_vals:
                 print(f"ON times - Min: {min(positive_vals)}µs, Max: {max(positive_vals)}µs, Avg: {sum(positive_vals)//len(positive_vals)}µs")
@@ -666,17 +831,18 @@ class InteractiveFlipperGenerator:
 
     def calculate_parameters(self):
         """Calculate protocol parameters"""
-        print(f"\n{Colors.CYAN}Protocol Parameter Calculator{Colors.ENDC}")
-        
-        print("1. Calculate timing element (TE) from bit rate")
-        print("2. Calculate frequency from wavelength")
-        print("3. Calculate bit count from key length")
+        _emit(
+            f"\n{Colors.CYAN}Protocol Parameter Calculator{Colors.ENDC}",
+            "1. Calculate timing element (TE) from bit rate",
+            "2. Calculate frequency from wavelength",
+            "3. Calculate bit count from key length"
+        )
         
-        choice = input("Select calculation: ").strip()
+        choice = _ask("Select calculation: ").strip()
         
         if choice == '1':
             try:
-                bit_rate = float(input("Bit rate (bps): "))
+                bit_rate = float(_ask("Bit rate (bps): "))
                 te = int(1000000 / bit_rate)  # Convert to microseconds
                 print(f"Timing element: {te} µs")
             except ValueError:
@@ -684,7 +850,7 @@ class InteractiveFlipperGenerator:
         
         elif choice == '2':
             try:
-                wavelength = float(input("Wavelength (cm): "))
+                wavelength = float(_ask("Wavelength (cm): "))
                 frequency = int(30000000000 / wavelength)  # Speed of light / wavelength
                 print(f"Frequency: {frequency:,} Hz ({frequency/1000000:.2f} MHz)")
             except ValueError:
@@ -692,8 +858,7 @@ class InteractiveFlipperGenerator:
         
         elif choice == '3':
             try:
-                key = input("Enter hex key: ").strip()
-                key = key.replace('0x', '')
+                key = _clean_hex(_ask("Enter hex key: "))
                 bits = len(key) * 4
                 print(f"Bit count: {bits} bits")
             except ValueError:
@@ -703,9 +868,8 @@ class InteractiveFlipperGenerator:
         """Convert hex to binary"""
         print(f"\n{Colors.CYAN}Hex to Binary Converter{Colors.ENDC}")
         
-        hex_data = input("Enter hex data: ").strip()
+        hex_data = _clean_hex(_ask("Enter hex data: "))
         try:
-            hex_data = hex_data.replace('0x', '')
             binary = bin(int(hex_data, 16))[2:]
             print(f"Binary: {binary}")
             print(f"Length: {len(binary)} bits")
@@ -719,46 +883,64 @@ class InteractiveFlipperGenerator:
         protocol_info = self.subghz_protocols[protocol]
         
         # Use actual key byte length from protocol specification
-        key_bytes = protocol_info['key_bytes']
-        hex_chars = key_bytes * 2  # 2 hex chars per byte
+        key_bytes = protocol_info.key_bytes
+        hex_chars = protocol_info.hex_chars
         print(f"Key length: {key_bytes} bytes ({hex_chars} hex characters)")
-        print(f"Protocol bits: {protocol_info['bits']} bits")
+        print(f"Protocol bits: {protocol_info.bits} bits")
         
-        key = input(f"{Colors.YELLOW}Enter hex key (or 'random' for random): {Colors.ENDC}").strip()
-        
-        if key.lower() == 'random':
-            # Generate random hex string with correct byte length
-            random_hex = ''.join(random.choice('0123456789ABCDEF') for _ in range(hex_chars))
+        while True:
+            key = _ask(PROMPTS['key']).strip()
+            
+            if key.lower() == 'random':
+                # Random key of the correct byte length from the OS CSPRNG
+                key = _bulk_random_keys(1, key_bytes)[0]
+                print(f"Generated random key: {key}")
+                break
+            
+            if not key:
+                break
+            
+            key_re = self._key_fast_re.get(key_bytes)
+            if key_re and key_re.fullmatch(key):
+                break
+            
+            # Pad with zeros if too short, truncate if too long; fromhex
+            # validates the digits while converting
+            key = _clean_hex(key)
+            try:
+                raw = bytes.fromhex(key.zfill(hex_chars)[:hex_chars])
+            except ValueError:
+                print(f"{Colors.RED}Invalid hex key. Use 0-9 and A-F only.{Colors.ENDC}")
+                continue
+            
+            if len(key) > hex_chars:
+                print(f"{Colors.YELLOW}Key truncated to {hex_chars} characters{Colors.ENDC}")
+            elif len(key) < hex_chars:
+                print(f"{Colors.YELLOW}Key padded to {hex_chars} characters{Colors.ENDC}")
+            
             # Format with spaces between byte pairs
-            key = ' '.join(random_hex[i:i+2] for i in range(0, len(random_hex), 2))
-            print(f"Generated random key: {key}")
-        else:
-            # Validate and format key length
-            if key:
-                key = key.replace('0x', '').replace(' ', '').upper()
-                if len(key) > hex_chars:
-                    key = key[:hex_chars]  # Truncate if too long
-                    print(f"{Colors.YELLOW}Key truncated to {hex_chars} characters{Colors.ENDC}")
-                elif len(key) < hex_chars:
-                    key = key.zfill(hex_chars)  # Pad with zeros if too short
-                    print(f"{Colors.YELLOW}Key padded to {hex_chars} characters{Colors.ENDC}")
-                
-                # Format with spaces between byte pairs
-                key = ' '.join(key[i:i+2] for i in range(0, len(key), 2))
+            key = raw.hex(' ').upper()
+            break
         
         # Data (optional for most protocols)
-        data = input(f"{Colors.YELLOW}Enter hex data (optional, press Enter to skip): {Colors.ENDC}").strip()
-        if data:
-            data = data.replace('0x', '').replace(' ', '').upper()
-            # Format data with spaces between byte pairs too
-            data = ' '.join(data[i:i+2] for i in range(0, len(data), 2))
+        while True:
+            data = _ask(PROMPTS['data']).strip()
+            if not data:
+                break
+            
+            data = _clean_hex(data)
+            try:
+                # Format data with spaces between byte pairs too; an odd
+                # digit count gets a leading zero so every pair is a full byte
+                data = bytes.fromhex(data.zfill(len(data) + len(data) % 2)).hex(' ').upper()
+                break
+            except ValueError:
+                print(f"{Colors.RED}Invalid hex data. Use 0-9 and A-F only.{Colors.ENDC}")
         
         # TE only for protocols that need it
         te = None
-        if protocol_info.get('needs_te', False):
-            default_te = protocol_info.get('default_te', 400)
-            te_input = input(f"{Colors.YELLOW}Timing element [{default_te}]: {Colors.ENDC}").strip()
-            te = int(te_input) if te_input else default_te
+        if protocol_info.needs_te:
+            te = _ask_default("Timing element", protocol_info.default_te)
         
         return key, data, te
 
@@ -768,234 +950,283 @@ class InteractiveFlipperGenerator:
         
         protocol_info = self.ir_protocols[protocol]
         
-        print(f"Address: {protocol_info['address_bits']} bits")
-        print(f"Command: {protocol_info['command_bits']} bits")
+        print(f"Address: {protocol_info.address_bits} bits")
+        print(f"Command: {protocol_info.command_bits} bits")
         
-        address = input(f"{Colors.YELLOW}Enter address (hex): {Colors.ENDC}").strip()
-        command = input(f"{Colors.YELLOW}Enter command (hex): {Colors.ENDC}").strip()
+        address = _ask(PROMPTS['address']).strip()
+        command = _ask(PROMPTS['command']).strip()
         
         return address.upper(), command.upper()
 
     def get_output_filename(self, extension: str) -> str:
         """Get output filename from user"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         default_name = f"flipper_{timestamp}.{extension}"
         
-        filename = input(f"{Colors.YELLOW}Output filename [{default_name}]: {Colors.ENDC}").strip()
+        filename = _ask(f"{Colors.YELLOW}Output filename [{default_name}]: {Colors.ENDC}").strip()
         return filename if filename else default_name
 
     def get_repeat_count(self) -> int:
         """Get repeat count from user"""
-        repeat_str = input(f"{Colors.YELLOW}Repeat count [1]: {Colors.ENDC}").strip()
-        return int(repeat_str) if repeat_str else 1
+        return _ask_default("Repeat count", 1)
 
     def get_ir_frequency(self) -> int:
         """Get IR carrier frequency"""
-        freq_str = input(f"{Colors.YELLOW}IR frequency [35715 Hz]: {Colors.ENDC}").strip()
-        return int(freq_str) if freq_str else 35715
+        return _ask_default("IR frequency", 35715, unit=" Hz")
 
     def get_duty_cycle(self) -> float:
         """Get PWM duty cycle"""
-        duty_str = input(f"{Colors.YELLOW}Duty cycle [0.33]: {Colors.ENDC}").strip()
-        return float(duty_str) if duty_str else 0.33
+        return _ask_default("Duty cycle", 0.33, cast=float)
 
     def show_raw_help(self):
         """Show help for RAW data entry"""
-        print(f"\n{Colors.CYAN}RAW Data Format Help:{Colors.ENDC}")
-        print("• Positive numbers = signal ON time (microseconds)")
-        print("• Negative numbers = signal OFF time (microseconds)")
-        print("• Values typically range from 100 to 10000 µs")
-        print("\nExamples:")
-        print("• NEC IR: 9000 -4500 560 -560 560 -1690 560 -560")
-        print("• Simple 433MHz: 500 -500 1000 -500 500 -1000")
-
-    def preview_timing(self, data: List[int]):
-        """Show a visual preview of timing data"""
-        print(f"\n{Colors.CYAN}Timing Preview (first {len(data)} values):{Colors.ENDC}")
-        for i, value in enumerate(data):
-            state = "ON " if value > 0 else "OFF"
-            print(f"{i:2d}: {state} {abs(value):4d}µs")
+        _emit(
+            f"\n{Colors.CYAN}RAW Data Format Help:{Colors.ENDC}",
+            "• Positive numbers = signal ON time (microseconds)",
+            "• Negative numbers = signal OFF time (microseconds)",
+            "• Values typically range from 100 to 10000 µs",
+            "\nExamples:",
+            "• NEC IR: 9000 -4500 560 -560 560 -1690 560 -560",
+            "• Simple 433MHz: 500 -500 1000 -500 500 -1000"
+        )
+
+    def preview_timing(self, data: List[int], limit: int = 20):
+        """Show a visual preview of the first `limit` timing values"""
+        lines = [f"\n{Colors.CYAN}Timing Preview (first {min(limit, len(data))} values):{Colors.ENDC}"]
+        # islice walks the head of the list without copying it
+        lines += [f"{i:2d}: {'ON ' if value > 0 else 'OFF'} {abs(value):4d}µs"
+                  for i, value in enumerate(islice(data, limit))]
+        _emit(*lines)
 
     def create_subghz_file(self, **kwargs) -> str:
-        """Create Sub-GHz file with given parameters - MATCHES FLIPPER FORMAT"""
-        lines = ["Filetype: Flipper SubGhz Key File", "Version: 1"]
+        """Create Sub-GHz file with given parameters"""
+        content = self.render_subghz_file(**kwargs)
+        filename = kwargs['output_file']
         
-        lines.append(f"Frequency: {kwargs['frequency']}")
-        lines.append(f"Preset: {kwargs.get('preset', 'FuriHalSubGhzPresetOok270Async')}")
-        lines.append(f"Protocol: {kwargs['protocol']}")
+        _write_file(filename, content.encode())
+        
+        self._print_created(filename, content)
+        return filename
+
+    def render_subghz_file(self, **kwargs) -> str:
+        """Render Sub-GHz file contents for the given parameters - MATCHES FLIPPER FORMAT"""
+        header = (
+            "Filetype: Flipper SubGhz Key File\n"
+            "Version: 1\n"
+            f"Frequency: {kwargs['frequency']}\n"
+            f"Preset: {kwargs.get('preset', 'FuriHalSubGhzPresetOok270Async')}\n"
+            f"Protocol: {kwargs['protocol']}\n"
+        )
         
         if kwargs['protocol'] == 'RAW':
-            lines.append(f"RAW_Data: {' '.join(map(str, kwargs['raw_data']))}")
-        else:
-            # Bit count (required for most protocols)
-            if kwargs.get('bit_count'):
-                lines.append(f"Bit: {kwargs['bit_count']}")
-            
-            # Key - already formatted with spaces in get_protocol_data
-            if kwargs.get('key'):
-                lines.append(f"Key: {kwargs['key']}")
-            
-            # Only add TE if specified (not all protocols need it)
-            if kwargs.get('te'):
-                lines.append(f"TE: {kwargs['te']}")
-            
-            # Data field (optional, also already formatted with spaces)
-            if kwargs.get('data'):
-                lines.append(f"Data: {kwargs['data']}")
-            
-            # Repeat count
-            repeat = kwargs.get('repeat', 1)
-            if repeat > 1:
-                lines.append(f"Repeat: {repeat}")
+            return f"{header}RAW_Data: {_format_timing(kwargs['raw_data'])}\n"
         
-        content = '\n'.join(lines) + '\n'
-        filename = kwargs['output_file']
+        # Bit count (required for most protocols)
+        bit_line = f"Bit: {kwargs['bit_count']}\n" if kwargs.get('bit_count') else ""
         
-        with open(filename, 'w') as f:
-            f.write(content)
+        # Key - already formatted with spaces in get_protocol_data
+        key_line = f"Key: {kwargs['key']}\n" if kwargs.get('key') else ""
         
-        print(f"\n{Colors.GREEN}✅ Created: {os.path.abspath(filename)}{Colors.ENDC}")
-        print(f"{Colors.CYAN}File contents:{Colors.ENDC}")
-        print(content)
-        return filename
+        # Only add TE if specified (not all protocols need it)
+        te_line = f"TE: {kwargs['te']}\n" if kwargs.get('te') else ""
+        
+        # Data field (optional, also already formatted with spaces)
+        data_line = f"Data: {kwargs['data']}\n" if kwargs.get('data') else ""
+        
+        # Repeat count
+        repeat = kwargs.get('repeat', 1)
+        repeat_line = f"Repeat: {repeat}\n" if repeat > 1 else ""
+        
+        return f"{header}{bit_line}{key_line}{te_line}{data_line}{repeat_line}"
 
     def create_ir_file(self, **kwargs) -> str:
         """Create IR file with given parameters"""
-        lines = ["Filetype: IR signals file", "Version: 1"]
-        
-        if kwargs['protocol'] == 'RAW':
-            lines.extend([
-                "name: Custom_RAW",
-                "type: raw",
-                f"frequency: {kwargs.get('frequency', 38000)}",
-                f"duty_cycle: {kwargs.get('duty_cycle', 0.33)}",
-                f"data: {' '.join(map(str, kwargs['raw_data']))}"
-            ])
-        else:
-            lines.extend([
-                f"name: Custom_{kwargs['protocol']}",
-                "type: parsed",
-                f"protocol: {kwargs['protocol']}",
-                f"address: {kwargs['address']}",
-                f"command: {kwargs['command']}"
-            ])
-        
-        content = '\n'.join(lines) + '\n'
+        content = self.render_ir_file(**kwargs)
         filename = kwargs['output_file']
         
-        with open(filename, 'w') as f:
-            f.write(content)
+        _write_file(filename, content.encode())
         
-        print(f"\n{Colors.GREEN}✅ Created: {os.path.abspath(filename)}{Colors.ENDC}")
-        print(f"{Colors.CYAN}File contents:{Colors.ENDC}")
-        print(content)
+        self._print_created(filename, content)
         return filename
 
+    def render_ir_file(self, **kwargs) -> str:
+        """Render IR file contents for the given parameters"""
+        if kwargs['protocol'] == 'RAW':
+            return (
+                "Filetype: IR signals file\n"
+                "Version: 1\n"
+                "name: Custom_RAW\n"
+                "type: raw\n"
+                f"frequency: {kwargs.get('frequency', 38000)}\n"
+                f"duty_cycle: {kwargs.get('duty_cycle', 0.33)}\n"
+                f"data: {_format_timing(kwargs['raw_data'])}\n"
+            )
+        
+        return (
+            "Filetype: IR signals file\n"
+            "Version: 1\n"
+            f"name: Custom_{kwargs['protocol']}\n"
+            "type: parsed\n"
+            f"protocol: {kwargs['protocol']}\n"
+            f"address: {kwargs['address']}\n"
+            f"command: {kwargs['command']}\n"
+        )
+
+    def _abspath(self, filename: str) -> str:
+        """os.path.abspath against the cached working directory"""
+        if os.sep not in filename and not (os.altsep and os.altsep in filename):
+            # Bare file name: nothing for normpath to collapse
+            return os.path.join(self._cwd, filename)
+        return os.path.normpath(os.path.join(self._cwd, filename))
+
+    def _print_created(self, filename: str, content: str):
+        """Report a written file and echo its contents"""
+        _emit(*self._created_lines(filename, content))
+
+    def _created_lines(self, filename: str, content: str) -> List[str]:
+        """Lines of the report printed after a file is written"""
+        return [
+            f"\n{Colors.GREEN}✅ Created: {self._abspath(filename)}{Colors.ENDC}",
+            f"{Colors.CYAN}File contents:{Colors.ENDC}",
+            content
+        ]
+
     def generate_samples(self):
         """Generate sample files"""
         print(f"\n{Colors.HEADER}📋 Sample File Generator{Colors.ENDC}")
         
-        # Create sample Sub-GHz files
-        print("Creating sample Sub-GHz files...")
-        
-        # Princeton sample (with TE since it needs it) - CORRECTED to 8-byte key
-        self.create_subghz_file(
-            protocol="Princeton",
-            frequency=433920000,
-            key="00 00 00 00 00 95 D5 D4",  # 8 bytes as per GitHub example
-            bit_count=24,
-            te=400,
-            output_file="sample_princeton.sub"
-        )
-        
-        # Holtek sample (no TE needed) - CORRECTED to 10-byte key  
-        self.create_subghz_file(
-            protocol="Holtek",
-            frequency=418000000,
-            key="00 00 52 AA AA BB CC DD EE FF",  # 10 bytes for 40-bit protocol
-            bit_count=40,
-            output_file="sample_holtek.sub"
-        )
-        
-        # RAW sample
-        sample_raw_data = [500, -500, 1000, -500, 500, -1000, 1000, -500]
-        self.create_subghz_file(
-            protocol="RAW",
-            frequency=315000000,
-            raw_data=sample_raw_data,
-            output_file="sample_raw.sub"
-        )
-        
-        # Create sample IR files
-        print("\nCreating sample IR files...")
-        
-        # NEC sample
-        self.create_ir_file(
-            protocol="NEC",
-            address="04",
-            command="08",
-            output_file="sample_nec.ir"
-        )
-        
-        # IR RAW sample
-        sample_ir_raw = [9000, -4500, 560, -560, 560, -1690, 560, -560, 560]
-        self.create_ir_file(
-            protocol="RAW",
-            raw_data=sample_ir_raw,
-            frequency=38000,
-            duty_cycle=0.33,
-            output_file="sample_ir_raw.ir"
-        )
-        
-        print(f"\n{Colors.GREEN}Sample files created successfully!{Colors.ENDC}")
+        subghz_samples = [
+            # Princeton sample (with TE since it needs it) - CORRECTED to 8-byte key
+            dict(
+                protocol="Princeton",
+                frequency=433920000,
+                key="00 00 00 00 00 95 D5 D4",  # 8 bytes as per GitHub example
+                bit_count=24,
+                te=400,
+                output_file="sample_princeton.sub"
+            ),
+            # Holtek sample (no TE needed) - CORRECTED to 10-byte key
+            dict(
+                protocol="Holtek",
+                frequency=418000000,
+                key="00 00 52 AA AA BB CC DD EE FF",  # 10 bytes for 40-bit protocol
+                bit_count=40,
+                output_file="sample_holtek.sub"
+            ),
+            # RAW sample
+            dict(
+                protocol="RAW",
+                frequency=315000000,
+                raw_data=[500, -500, 1000, -500, 500, -1000, 1000, -500],
+                output_file="sample_raw.sub"
+            )
+        ]
+        
+        ir_samples = [
+            # NEC sample
+            dict(
+                protocol="NEC",
+                address="04",
+                command="08",
+                output_file="sample_nec.ir"
+            ),
+            # IR RAW sample
+            dict(
+                protocol="RAW",
+                raw_data=[9000, -4500, 560, -560, 560, -1690, 560, -560, 560],
+                frequency=38000,
+                duty_cycle=0.33,
+                output_file="sample_ir_raw.ir"
+            )
+        ]
+        
+        # Render everything first, then write the independent files concurrently;
+        # list() waits for every write and re-raises the first failure
+        from concurrent.futures import ThreadPoolExecutor
+        subghz_files = [(spec['output_file'], self.render_subghz_file(**spec)) for spec in subghz_samples]
+        ir_files = [(spec['output_file'], self.render_ir_file(**spec)) for spec in ir_samples]
+        batch = subghz_files + ir_files
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_write_file, [name for name, _ in batch], [content.encode() for _, content in batch]))
+        
+        # The whole report goes out in one write
+        lines = ["Creating sample Sub-GHz files..."]
+        for filename, content in subghz_files:
+            lines += self._created_lines(filename, content)
+        
+        lines.append("\nCreating sample IR files...")
+        for filename, content in ir_files:
+            lines += self._created_lines(filename, content)
+        
+        lines.append(f"\n{Colors.GREEN}Sample files created successfully!{Colors.ENDC}")
+        _emit(*lines)
 
     def view_protocols(self):
         """Display protocol information"""
-        print(f"\n{Colors.HEADER}📖 Protocol Information{Colors.ENDC}")
+        sys.stdout.write(self._protocols_blob)
+
+    def _render_protocol_info(self) -> str:
+        """Render the protocol information screen shown by view_protocols"""
+        lines = [f"\n{Colors.HEADER}📖 Protocol Information{Colors.ENDC}"]
         
-        print(f"\n{Colors.CYAN}Sub-GHz Protocols:{Colors.ENDC}")
+        lines.append(f"\n{Colors.CYAN}Sub-GHz Protocols:{Colors.ENDC}")
         for name, info in self.subghz_protocols.items():
             if name != "RAW":
-                te_info = f", TE required" if info.get('needs_te') else ", no TE"
-                print(f"• {name:15} - {info['bits']:2d} bits, {info['key_bytes']:2d} key bytes{te_info} - {info['description']}")
+                te_info = ", TE required" if info.needs_te else ", no TE"
+                lines.append(f"• {name:15} - {info.bits:2d} bits, {info.key_bytes:2d} key bytes{te_info} - {info.description}")
             else:
-                print(f"• {name:15} - Custom timing data - {info['description']}")
+                lines.append(f"• {name:15} - Custom timing data - {info.description}")
         
-        print(f"\n{Colors.CYAN}IR Protocols:{Colors.ENDC}")
+        lines.append(f"\n{Colors.CYAN}IR Protocols:{Colors.ENDC}")
         for name, info in self.ir_protocols.items():
             if name != "RAW":
-                addr_bits = info['address_bits']
-                cmd_bits = info['command_bits']
-                print(f"• {name:15} - Addr:{addr_bits:2d}b, Cmd:{cmd_bits:2d}b - {info['description']}")
+                lines.append(f"• {name:15} - Addr:{info.address_bits:2d}b, Cmd:{info.command_bits:2d}b - {info.description}")
             else:
-                print(f"• {name:15} - Custom timing data - {info['description']}")
+                lines.append(f"• {name:15} - Custom timing data - {info.description}")
         
-        print(f"\n{Colors.CYAN}Supported Frequencies:{Colors.ENDC}")
-        for name, freq in self.common_frequencies.items():
-            print(f"• {name} ({freq:,} Hz)")
+        lines.append(f"\n{Colors.CYAN}Supported Frequencies:{Colors.ENDC}")
+        lines += [f"• {name} ({freq:,} Hz)" for name, freq in self.common_frequencies.items()]
         
-        print(f"\n{Colors.CYAN}Flipper Zero Frequency Ranges:{Colors.ENDC}")
-        print("• 300-348 MHz")
-        print("• 387-464 MHz")
-        print("• 779-928 MHz")
+        lines.append(f"\n{Colors.CYAN}Flipper Zero Frequency Ranges:{Colors.ENDC}")
+        lines += [f"• {start // 1000000}-{end // 1000000} MHz" for start, end in _FREQ_RANGES]
+        
+        return "\n".join(lines) + "\n"
+
+_FAST_FLAGS = frozenset(('-i', '--interactive', '--no-color'))
+
+def _parse_args(argv: List[str]) -> Tuple[bool, bool]:
+    """Return (interactive, no_color) for the given command line arguments"""
+    # The common flags are read directly; argparse is only loaded for
+    # --help, abbreviations or anything it has to reject
+    if _FAST_FLAGS.issuperset(argv):
+        return '-i' in argv or '--interactive' in argv, '--no-color' in argv
+    
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Flipper Zero Protocol Generator")
+    parser.add_argument('--interactive', '-i', action='store_true', 
+                      help='Start interactive mode')
+    parser.add_argument('--no-color', action='store_true',
+                      help='Disable colored output')
+    
+    args = parser.parse_args(argv)
+    return args.interactive, args.no_color
 
 def main():
     """Main application entry point"""
+    # Disable before anything renders so cached menus come out plain
+    if not _color_supported():
+        Colors.disable()
+    
     # Check if running in interactive mode or with command line args
     if len(sys.argv) > 1:
         # Command line mode (original functionality)
-        parser = argparse.ArgumentParser(description="Flipper Zero Protocol Generator")
-        parser.add_argument('--interactive', '-i', action='store_true', 
-                          help='Start interactive mode')
-        parser.add_argument('--no-color', action='store_true',
-                          help='Disable colored output')
-        
-        args = parser.parse_args()
+        interactive, no_color = _parse_args(sys.argv[1:])
         
-        if args.no_color:
+        if no_color:
             Colors.disable()
         
-        if args.interactive:
+        if interactive:
             # Interactive mode
             generator = InteractiveFlipperGenerator()
             generator.print_banner()